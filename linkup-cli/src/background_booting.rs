@@ -16,6 +16,7 @@ use crate::background_local_server::{
 use crate::background_tunnel::start_tunnel;
 use crate::local_config::{LocalState, ServiceTarget};
 use crate::start::save_state;
+use crate::stop::stop_tunnel;
 use crate::{start::get_state, CliError};
 use crate::{LINKUP_ENV_SEPARATOR, LINKUP_LOCALSERVER_PORT};
 
@@ -30,12 +31,25 @@ pub fn boot_background_services() -> Result<(), CliError> {
         start_local_server()?;
     }
 
-    wait_till_ok(format!("{}linkup-check", local_url))?;
-
+    // The tunnel does not need the local server to be up to register, so boot
+    // it while the local server is still starting instead of waiting first
+    let mut tunnel_started_here = false;
     if is_tunnel_started().is_err() {
         println!("starting tunnel...");
         let tunnel = start_tunnel()?;
         state.linkup.tunnel = tunnel;
+        tunnel_started_here = true;
+    }
+
+    if let Err(e) = wait_till_ok(format!("{}linkup-check", local_url)) {
+        // Don't leave a tunnel we just started running in front of a local
+        // server that never came up
+        if tunnel_started_here {
+            if let Err(stop_err) = stop_tunnel() {
+                println!("Could not stop tunnel: {}", stop_err);
+            }
+        }
+        return Err(e);
     }
 
     for service in &state.services {
@@ -47,12 +61,15 @@ pub fn boot_background_services() -> Result<(), CliError> {
 
     let (local_server_conf, remote_server_conf) = server_config_from_state(&state);
 
+    let client = Client::new();
     let server_session_name = load_config(
+        &client,
         &state.linkup.remote,
         &state.linkup.session_name,
         remote_server_conf,
     )?;
-    let local_session_name = load_config(&local_url, &server_session_name, local_server_conf)?;
+    let local_session_name =
+        load_config(&client, &local_url, &server_session_name, local_server_conf)?;
 
     if server_session_name != local_session_name {
         return Err(CliError::InconsistentState);
@@ -75,8 +92,12 @@ pub fn boot_background_services() -> Result<(), CliError> {
     Ok(())
 }
 
-fn load_config(url: &Url, desired_name: &str, config: StorableSession) -> Result<String, CliError> {
-    let client = Client::new();
+fn load_config(
+    client: &Client,
+    url: &Url,
+    desired_name: &str,
+    config: StorableSession,
+) -> Result<String, CliError> {
     let endpoint = url
         .join("/linkup")
         .map_err(|e| CliError::LoadConfig(url.to_string(), e.to_string()))?;
@@ -218,26 +239,19 @@ fn set_service_env(directory: String, config_path: String) -> Result<(), CliErro
         .open(env_path)
         .map_err(|e| CliError::SetServiceEnv(directory.clone(), e.to_string()))?;
 
-    writeln!(env_file, "{}", LINKUP_ENV_SEPARATOR).map_err(|e| {
-        CliError::SetServiceEnv(
-            directory.clone(),
-            format!("could not write to env file: {}", e),
-        )
-    })?;
-
-    writeln!(env_file, "{}", dev_env_content).map_err(|e| {
-        CliError::SetServiceEnv(
-            directory.clone(),
-            format!("could not write to env file: {}", e),
-        )
-    })?;
-
-    writeln!(env_file, "{}", LINKUP_ENV_SEPARATOR).map_err(|e| {
-        CliError::SetServiceEnv(
-            directory.clone(),
-            format!("could not write to env file: {}", e),
-        )
-    })?;
+    let linkup_env_block = format!(
+        "{}\n{}\n{}\n",
+        LINKUP_ENV_SEPARATOR, dev_env_content, LINKUP_ENV_SEPARATOR
+    );
+
+    env_file
+        .write_all(linkup_env_block.as_bytes())
+        .map_err(|e| {
+            CliError::SetServiceEnv(
+                directory.clone(),
+                format!("could not write to env file: {}", e),
+            )
+        })?;
 
     Ok(())
 }
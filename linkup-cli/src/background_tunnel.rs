@@ -3,7 +3,7 @@ use std::io::{BufRead, BufReader};
 use std::process::{self, Command, Stdio};
 use std::sync::{mpsc, Once};
 use std::thread;
-use std::time::Duration;
+use std::time::{Duration, Instant};
 
 use daemonize::{Daemonize, Outcome};
 use regex::Regex;
@@ -19,6 +19,7 @@ const LINKUP_CLOUDFLARED_STDOUT: &str = "cloudflared-stdout";
 const LINKUP_CLOUDFLARED_STDERR: &str = "cloudflared-stderr";
 
 const TUNNEL_START_WAIT: u64 = 20;
+const TUNNEL_STARTED_MARKER: &str = "Registered tunnel connection";
 
 pub fn start_tunnel() -> Result<Url, CliError> {
     let mut attempt = 0;
@@ -77,51 +78,65 @@ fn try_start_tunnel() -> Result<Url, CliError> {
 
     let tunnel_url_re =
         Regex::new(r"https://[a-zA-Z0-9-]+\.trycloudflare\.com").expect("Failed to compile regex");
-    let tunnel_started_re =
-        Regex::new(r"Registered tunnel connection").expect("Failed to compile regex");
 
     let (tx, rx) = mpsc::channel();
     thread::spawn(move || {
+        let stderr_file = match File::open(linkup_file_path(LINKUP_CLOUDFLARED_STDERR)) {
+            Ok(file) => file,
+            Err(_) => {
+                let err = CliError::StartLocalTunnel(
+                    "Failed to open stdout file for local tunnel".to_string(),
+                );
+                tx.send(Err(err)).expect("Failed to send stderr_file error");
+                return;
+            }
+        };
+
+        // Keep the log open and pick up from where the last read stopped,
+        // rather than re-reading the whole file on every poll
+        let mut buf_reader = BufReader::new(stderr_file);
+        let mut line = Vec::new();
         let mut url = None;
         let mut found_started = false;
 
+        // Stop watching once the caller has given up on this attempt, a retry
+        // truncates the log and starts a new watcher
+        let deadline = Instant::now() + Duration::from_secs(TUNNEL_START_WAIT);
+
         loop {
-            let stderr_file =
-                File::open(linkup_file_path(LINKUP_CLOUDFLARED_STDERR)).map_err(|_| {
-                    CliError::StartLocalTunnel(
-                        "Failed to open stdout file for local tunnel".to_string(),
-                    )
-                });
-
-            match stderr_file {
-                Ok(file) => {
-                    let buf_reader: BufReader<File> = BufReader::new(file);
-
-                    for line in buf_reader.lines() {
-                        let line = line.unwrap_or_default();
-                        if let Some(url_match) = tunnel_url_re.find(&line) {
-                            let found_url =
-                                Url::parse(url_match.as_str()).expect("Failed to parse tunnel URL");
-                            url = Some(found_url);
-                        }
-
-                        if let Some(_started_match) = tunnel_started_re.find(&line) {
-                            found_started = true;
-                        }
-
-                        if url.is_some() && found_started {
-                            let u = url.unwrap();
-                            tx.send(Ok(u)).expect("Failed to send tunnel URL");
-                            return;
-                        }
+            // Bytes read before an error stay in `line`, so a partially read
+            // line is never lost
+            match buf_reader.read_until(b'\n', &mut line) {
+                Ok(_) if line.ends_with(b"\n") => {}
+                // Caught up with cloudflared, or the rest of the line has not been
+                // written yet, wait for it to write more
+                Ok(_) | Err(_) => {
+                    if Instant::now() >= deadline {
+                        return;
                     }
+                    thread::sleep(Duration::from_millis(100));
+                    continue;
                 }
-                Err(err) => {
-                    tx.send(Err(err)).expect("Failed to send stderr_file error");
-                }
-            };
+            }
+
+            let text = String::from_utf8_lossy(&line);
+
+            if let Some(url_match) = tunnel_url_re.find(&text) {
+                let found_url = Url::parse(url_match.as_str()).expect("Failed to parse tunnel URL");
+                url = Some(found_url);
+            }
+
+            if text.contains(TUNNEL_STARTED_MARKER) {
+                found_started = true;
+            }
+
+            if url.is_some() && found_started {
+                // The receiver is gone if the attempt already timed out
+                let _ = tx.send(Ok(url.unwrap()));
+                return;
+            }
 
-            thread::sleep(Duration::from_millis(100));
+            line.clear();
         }
     });
 
@@ -9,6 +9,11 @@ use linkup::*;
 
 use crate::LINKUP_LOCALSERVER_PORT;
 
+// Upper bound on how much of a declared Content-Length is allocated up front.
+// Only multi-chunk bodies reserve anything, and this still covers multi-MB
+// responses while keeping a bogus header from forcing a huge allocation
+const MAX_BODY_PREALLOC: u64 = 16 * 1024 * 1024;
+
 #[derive(Error, Debug)]
 pub enum ProxyError {
     #[error("reqwest proxy error {0}")]
@@ -139,16 +144,44 @@ fn merge_headers(
     header_map
 }
 
+async fn next_chunk(response: &mut reqwest::Response) -> Result<Option<web::Bytes>, ProxyError> {
+    response
+        .chunk()
+        .await
+        .map_err(|e| ProxyError::ReqwestProxyError(e.to_string()))
+}
+
 async fn convert_reqwest_response(
-    response: reqwest::Response,
+    mut response: reqwest::Response,
     extra_headers: HashMap<String, String>,
 ) -> Result<HttpResponse, ProxyError> {
     let status_code = response.status();
     let headers = response.headers().clone();
-    let body = response
-        .bytes()
-        .await
-        .map_err(|e| ProxyError::ReqwestProxyError(e.to_string()))?;
+    // Read before any chunk is consumed, the length shrinks as the body is read
+    let declared_len = response.content_length();
+
+    let body = match next_chunk(&mut response).await? {
+        None => web::Bytes::new(),
+        Some(first) => match next_chunk(&mut response).await? {
+            // Single-chunk bodies are passed through without copying
+            None => first,
+            // Only multi-chunk bodies are collected, into a buffer sized from
+            // Content-Length so bodies up to MAX_BODY_PREALLOC are not regrown
+            Some(second) => {
+                let capacity = declared_len.unwrap_or(0).min(MAX_BODY_PREALLOC) as usize;
+                let mut buf =
+                    web::BytesMut::with_capacity(capacity.max(first.len() + second.len()));
+                buf.extend_from_slice(&first);
+                buf.extend_from_slice(&second);
+
+                while let Some(chunk) = next_chunk(&mut response).await? {
+                    buf.extend_from_slice(&chunk);
+                }
+
+                buf.freeze()
+            }
+        },
+    };
 
     let mut response_builder = HttpResponse::build(status_code);
     for (key, value) in headers.iter() {
@@ -1,7 +1,4 @@
-use std::{
-    env,
-    fs::{self, File},
-};
+use std::{env, fs};
 
 use crate::{
     background_booting::boot_background_services,
@@ -79,10 +76,6 @@ fn get_config(config_path: String) -> Result<YamlLocalConfig, CliError> {
 }
 
 pub fn get_state() -> Result<LocalState, CliError> {
-    if let Err(e) = File::open(linkup_file_path(LINKUP_STATE_FILE)) {
-        return Err(CliError::NoState(e.to_string()));
-    }
-
     let content = match fs::read_to_string(linkup_file_path(LINKUP_STATE_FILE)) {
         Ok(content) => content,
         Err(e) => return Err(CliError::NoState(e.to_string())),
@@ -104,10 +97,17 @@ pub fn save_state(state: LocalState) -> Result<(), CliError> {
         }
     };
 
-    if fs::write(linkup_file_path(LINKUP_STATE_FILE), yaml_string).is_err() {
+    // Write to a temp file and rename it over the state file so readers never
+    // see a partially written state
+    let state_path = linkup_file_path(LINKUP_STATE_FILE);
+    let temp_state_path = state_path.with_extension("temp");
+
+    if fs::write(&temp_state_path, yaml_string).is_err()
+        || fs::rename(&temp_state_path, &state_path).is_err()
+    {
         return Err(CliError::SaveState(format!(
             "Failed to write the state file at {}",
-            linkup_file_path(LINKUP_STATE_FILE).display()
+            state_path.display()
         )));
     }
 
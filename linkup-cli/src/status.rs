@@ -1,4 +1,5 @@
 use colored::{ColoredString, Colorize};
+use reqwest::blocking::Client;
 use serde::{Deserialize, Serialize};
 use std::{thread, time::Duration};
 
@@ -58,9 +59,16 @@ impl From<Result<reqwest::blocking::Response, reqwest::Error>> for ServerStatus
 pub fn status(json: bool) -> Result<(), CliError> {
     let state = get_state()?;
 
+    // Share a single client across all checks so they reuse one connection pool
+    // instead of each building its own client and runtime
+    let client = Client::builder()
+        .timeout(Duration::from_secs(2))
+        .build()
+        .map_err(|e| CliError::StatusErr(e.to_string()))?;
+
     let (tx, rx) = std::sync::mpsc::channel();
-    linkup_status(tx.clone(), &state);
-    service_status(tx.clone(), &state);
+    linkup_status(tx.clone(), &state, &client);
+    service_status(tx.clone(), &state, &client);
 
     drop(tx);
 
@@ -140,16 +148,17 @@ pub fn status(json: bool) -> Result<(), CliError> {
     Ok(())
 }
 
-fn linkup_status(tx: std::sync::mpsc::Sender<ServiceStatus>, state: &LocalState) {
+fn linkup_status(tx: std::sync::mpsc::Sender<ServiceStatus>, state: &LocalState, client: &Client) {
     let local_url = format!("http://localhost:{}", LINKUP_LOCALSERVER_PORT);
 
     let local_tx = tx.clone();
+    let local_client = client.clone();
     thread::spawn(move || {
         let service_status = ServiceStatus {
             name: "local_server".to_string(),
             component_kind: "linkup".to_string(),
             location: local_url.clone(),
-            status: server_status(local_url),
+            status: server_status(&local_client, local_url),
         };
 
         local_tx
@@ -160,12 +169,13 @@ fn linkup_status(tx: std::sync::mpsc::Sender<ServiceStatus>, state: &LocalState)
     let remote_tx = tx.clone();
     // TODO(augustoccesar): having to clone this remote on the ServiceStatus feels unnecessary. Look if it can be reference
     let remote = state.linkup.remote.to_string();
+    let remote_client = client.clone();
     thread::spawn(move || {
         let service_status = ServiceStatus {
             name: "remote_server".to_string(),
             component_kind: "linkup".to_string(),
             location: remote.clone(),
-            status: server_status(remote),
+            status: server_status(&remote_client, remote),
         };
 
         remote_tx
@@ -176,12 +186,13 @@ fn linkup_status(tx: std::sync::mpsc::Sender<ServiceStatus>, state: &LocalState)
     // NOTE(augustoccesar): last usage of tx on this context, no need to clone it
     let tunnel_tx = tx;
     let tunnel = state.linkup.tunnel.to_string();
+    let tunnel_client = client.clone();
     thread::spawn(move || {
         let service_status = ServiceStatus {
             name: "tunnel".to_string(),
             component_kind: "linkup".to_string(),
             location: tunnel.clone(),
-            status: server_status(tunnel),
+            status: server_status(&tunnel_client, tunnel),
         };
 
         tunnel_tx
@@ -190,9 +201,10 @@ fn linkup_status(tx: std::sync::mpsc::Sender<ServiceStatus>, state: &LocalState)
     });
 }
 
-fn service_status(tx: std::sync::mpsc::Sender<ServiceStatus>, state: &LocalState) {
+fn service_status(tx: std::sync::mpsc::Sender<ServiceStatus>, state: &LocalState, client: &Client) {
     for service in state.services.iter().cloned() {
         let tx = tx.clone();
+        let client = client.clone();
 
         thread::spawn(move || {
             let url = match service.current {
@@ -204,7 +216,7 @@ fn service_status(tx: std::sync::mpsc::Sender<ServiceStatus>, state: &LocalState
                 name: service.name,
                 location: url.to_string(),
                 component_kind: service.current.to_string(),
-                status: server_status(url.to_string()),
+                status: server_status(&client, url.to_string()),
             };
 
             tx.send(service_status)
@@ -213,13 +225,6 @@ fn service_status(tx: std::sync::mpsc::Sender<ServiceStatus>, state: &LocalState
     }
 }
 
-fn server_status(url: String) -> ServerStatus {
-    let client = reqwest::blocking::Client::builder()
-        .timeout(Duration::from_secs(2))
-        .build();
-
-    match client {
-        Ok(client) => client.get(url).send().into(),
-        Err(_) => ServerStatus::Error,
-    }
+fn server_status(client: &Client, url: String) -> ServerStatus {
+    client.get(url).send().into()
 }
@@ -1,5 +1,5 @@
 use std::fs::{self, File, OpenOptions};
-use std::io::{BufRead, BufReader, Write};
+use std::io::{BufRead, BufReader, BufWriter, Read, Write};
 use std::path::{Path, PathBuf};
 
 use crate::signal::{send_sigint, PidError};
@@ -67,12 +67,14 @@ pub fn stop_tunnel() -> Result<(), CliError> {
 }
 
 fn get_pid(file_name: &str) -> Result<String, PidError> {
-    if let Err(e) = File::open(linkup_file_path(file_name)) {
-        return Err(PidError::NoPidFile(e.to_string()));
-    }
+    let mut pid_file = match File::open(linkup_file_path(file_name)) {
+        Ok(file) => file,
+        Err(e) => return Err(PidError::NoPidFile(e.to_string())),
+    };
 
-    match fs::read_to_string(linkup_file_path(file_name)) {
-        Ok(content) => Ok(content.trim().to_string()),
+    let mut content = String::new();
+    match pid_file.read_to_string(&mut content) {
+        Ok(_) => Ok(content.trim().to_string()),
         Err(e) => Err(PidError::BadPidFile(e.to_string())),
     }
 }
@@ -93,7 +95,7 @@ fn remove_service_env(directory: String, config_path: String) -> Result<(), CliE
     })?;
     let reader = BufReader::new(input_file);
 
-    let mut output_file = OpenOptions::new()
+    let output_file = OpenOptions::new()
         .create(true)
         .write(true)
         .truncate(true)
@@ -101,6 +103,7 @@ fn remove_service_env(directory: String, config_path: String) -> Result<(), CliE
         .map_err(|e| {
             CliError::RemoveServiceEnv(directory.clone(), format!("could not open env file: {}", e))
         })?;
+    let mut writer = BufWriter::new(output_file);
 
     let mut copy = true;
 
@@ -118,7 +121,7 @@ fn remove_service_env(directory: String, config_path: String) -> Result<(), CliE
         }
 
         if copy {
-            writeln!(output_file, "{}", line).map_err(|e| {
+            writeln!(writer, "{}", line).map_err(|e| {
                 CliError::RemoveServiceEnv(
                     directory.clone(),
                     format!("could not write line to env file: {}", e),
@@ -127,6 +130,13 @@ fn remove_service_env(directory: String, config_path: String) -> Result<(), CliE
         }
     }
 
+    writer.flush().map_err(|e| {
+        CliError::RemoveServiceEnv(
+            directory.clone(),
+            format!("could not write env file: {}", e),
+        )
+    })?;
+
     fs::rename(&temp_env_path, &env_path).map_err(|e| {
         CliError::RemoveServiceEnv(
             directory.clone(),
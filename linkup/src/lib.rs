@@ -111,30 +111,23 @@ pub fn get_target_url(
     let target = Url::parse(&url).unwrap();
     let path = target.path();
 
-    let url_target = config.domains.get(&get_target_domain(&url, session_name));
-
-    // Forwarded hosts persist over the tunnel
-    let forwarded_host_target = config.domains.get(
-        headers
-            .get("x-forwarded-host")
-            .unwrap_or(&"does-not-exist".to_string()),
-    );
-
-    // This is more for e2e tests to work
-    let referer_target = config.domains.get(&get_target_domain(
-        headers
-            .get("referer")
-            .unwrap_or(&"does-not-exist".to_string()),
-        session_name,
-    ));
-
-    let target_domain = if url_target.is_some() {
-        url_target
-    } else if forwarded_host_target.is_some() {
-        forwarded_host_target
-    } else {
-        referer_target
-    };
+    let target_domain = config
+        .domains
+        .get(&get_target_domain(&url, session_name))
+        // Forwarded hosts persist over the tunnel
+        .or_else(|| {
+            headers
+                .get("x-forwarded-host")
+                .and_then(|host| config.domains.get(host))
+        })
+        // This is more for e2e tests to work
+        .or_else(|| {
+            headers.get("referer").and_then(|referer| {
+                config
+                    .domains
+                    .get(&get_target_domain(referer, session_name))
+            })
+        });
 
     if let Some(domain) = target_domain {
         let service_name = domain
@@ -189,16 +182,19 @@ fn get_target_domain(url: &str, session_name: &str) -> String {
         .or_else(|| url.strip_prefix("https://"))
         .unwrap_or(url);
 
-    let domain_with_path: String = if first_subdomain(url) == *session_name {
+    let domain_with_path = if first_subdomain(url) == *session_name {
         without_schema
             .strip_prefix(&format!("{}.", session_name))
-            .map(String::from)
-            .unwrap_or_else(|| without_schema.to_string())
+            .unwrap_or(without_schema)
     } else {
-        without_schema.to_string()
+        without_schema
     };
 
-    domain_with_path.split('/').collect::<Vec<_>>()[0].to_string()
+    domain_with_path
+        .split('/')
+        .next()
+        .unwrap_or_default()
+        .to_string()
 }
 
 fn first_subdomain(url: &str) -> String {
@@ -206,11 +202,13 @@ fn first_subdomain(url: &str) -> String {
         .strip_prefix("http://")
         .or_else(|| url.strip_prefix("https://"))
         .unwrap_or(url);
-    let parts: Vec<&str> = without_schema.split('.').collect();
-    if parts.len() <= 2 {
+    // Only hosts with at least three labels have a subdomain
+    let mut parts = without_schema.split('.');
+    let first = parts.next().unwrap_or_default();
+    if parts.nth(1).is_none() {
         String::from("")
     } else {
-        String::from(parts[0])
+        String::from(first)
     }
 }
 
@@ -462,4 +460,97 @@ mod tests {
             "http://localhost:8001/api/v1/?a=b".to_string(),
         );
     }
+
+    #[test]
+    fn test_get_target_url_fallbacks() {
+        let config_value: serde_json::Value = serde_json::from_str(CONF_STR).unwrap();
+        let config: Session = config_value.try_into().unwrap();
+        let name = "tiny-cow";
+
+        // URL host misses, resolves through x-forwarded-host
+        let mut forwarded_headers: HashMap<String, String> = HashMap::new();
+        forwarded_headers.insert(
+            "x-forwarded-host".to_string(),
+            "api.example.com".to_string(),
+        );
+        assert_eq!(
+            get_target_url(
+                "http://tiny-cow.some-tunnel.com/a/b?a=b".to_string(),
+                forwarded_headers,
+                &config,
+                name
+            )
+            .unwrap(),
+            "http://localhost:8001/a/b?a=b".to_string(),
+        );
+
+        // URL host and x-forwarded-host miss, resolves through referer
+        let mut referer_headers: HashMap<String, String> = HashMap::new();
+        referer_headers.insert("x-forwarded-host".to_string(), "unknown.com".to_string());
+        referer_headers.insert(
+            "referer".to_string(),
+            "http://tiny-cow.example.com/page".to_string(),
+        );
+        assert_eq!(
+            get_target_url(
+                "http://tiny-cow.some-tunnel.com/a/b?a=b".to_string(),
+                referer_headers,
+                &config,
+                name
+            )
+            .unwrap(),
+            "http://localhost:8000/a/b?a=b".to_string(),
+        );
+
+        // URL host takes precedence over x-forwarded-host and referer
+        let mut all_headers: HashMap<String, String> = HashMap::new();
+        all_headers.insert(
+            "x-forwarded-host".to_string(),
+            "api.example.com".to_string(),
+        );
+        all_headers.insert(
+            "referer".to_string(),
+            "http://api.example.com/page".to_string(),
+        );
+        assert_eq!(
+            get_target_url(
+                "http://tiny-cow.example.com/a/b?a=b".to_string(),
+                all_headers,
+                &config,
+                name
+            )
+            .unwrap(),
+            "http://localhost:8000/a/b?a=b".to_string(),
+        );
+
+        // x-forwarded-host takes precedence over referer
+        let mut forwarded_and_referer: HashMap<String, String> = HashMap::new();
+        forwarded_and_referer.insert(
+            "x-forwarded-host".to_string(),
+            "api.example.com".to_string(),
+        );
+        forwarded_and_referer.insert(
+            "referer".to_string(),
+            "http://tiny-cow.example.com/page".to_string(),
+        );
+        assert_eq!(
+            get_target_url(
+                "http://tiny-cow.some-tunnel.com/a/b?a=b".to_string(),
+                forwarded_and_referer,
+                &config,
+                name
+            )
+            .unwrap(),
+            "http://localhost:8001/a/b?a=b".to_string(),
+        );
+
+        // Nothing matches
+        assert!(get_target_url(
+            "http://tiny-cow.some-tunnel.com/a/b?a=b".to_string(),
+            HashMap::new(),
+            &config,
+            name
+        )
+        .is_none());
+    }
 }
@@ -2,7 +2,7 @@ use std::{collections::HashMap, sync::Arc};
 
 use crate::{
     extract_tracestate_session, first_subdomain, random_animal, random_six_char, session_to_json,
-    ConfigError, NameKind, Session, SessionError, StringStore,
+    ConfigError, NameKind, Session, SessionError, StorableSession, StringStore,
 };
 
 pub struct SessionAllocator {
@@ -84,10 +84,10 @@ impl SessionAllocator {
             Err(e) => return Err(e),
         };
 
-        let config_value: serde_json::Value =
+        let storable_session: StorableSession =
             serde_json::from_str(&value).map_err(|e| SessionError::ConfigErr(e.to_string()))?;
 
-        let session_config = config_value
+        let session_config = storable_session
             .try_into()
             .map_err(|e: ConfigError| SessionError::ConfigErr(e.to_string()))?;
 